@@ -33,6 +33,7 @@ log = logging.getLogger(__name__)
 
 _IS_WINDOWS = sys.platform == "win32"
 _IS_MACOS = sys.platform == "darwin"
+_EXTRACTOR_SCRIPT = Path(__file__).parent.parent / "utils" / "extract_scene_info.py"
 
 
 # Module-level state to track active extraction safely across operator calls
@@ -130,6 +131,11 @@ def add_recent_blend_file(prefs, new_path):
         prefs.recent_blend_files.remove(0)
 
 
+def _get_blend_cache_dir() -> Path:
+    """Folder holding extracted scene info."""
+    return get_addon_temp_dir() / "blend_cache"
+
+
 def generate_cache_key(blend_path_obj: Path, script_path: Path) -> str:
     """Generate a cache key based on file identity (name, size, mtime)"""
     try:
@@ -201,13 +207,12 @@ class RECOM_OT_ExtractExternalSceneData(Operator):
         context.preferences.is_dirty = True
 
         # Prepare paths
-        script_path = (Path(__file__).parent / "../utils/extract_scene_info.py").resolve()
+        script_path = _EXTRACTOR_SCRIPT
         if not script_path.is_file():
             self.report({"ERROR"}, "Extractor script not found")
             return {"CANCELLED"}
 
-        temp_dir = get_addon_temp_dir()
-        cache_dir = temp_dir / "blend_cache"
+        cache_dir = _get_blend_cache_dir()
         cache_dir.mkdir(parents=True, exist_ok=True)
 
         cache_key = generate_cache_key(blend_path_obj, script_path)
@@ -266,7 +271,8 @@ class RECOM_OT_ExtractExternalSceneData(Operator):
             "--factory-startup",
         ]
 
-        log.info('Launching background extraction: "%s"', " ".join(cmd))
+        if log.isEnabledFor(logging.INFO):
+            log.info('Launching background extraction: "%s"', " ".join(cmd))
         _extraction_state["process"] = subprocess.Popen(
             cmd,
             env=env,
@@ -346,9 +352,8 @@ class RECOM_OT_ClearAndReloadSceneInfo(Operator):
             return {"CANCELLED"}
 
         # Calculate cache path based on the external blend file
-        temp_dir = get_addon_temp_dir()
-        cache_dir = temp_dir / "blend_cache"
-        script_path = (Path(__file__).parent / "../utils/extract_scene_info.py").resolve()
+        cache_dir = _get_blend_cache_dir()
+        script_path = _EXTRACTOR_SCRIPT
 
         cache_key = generate_cache_key(Path(external_blend_path), script_path)
         cache_path = cache_dir / f"{cache_key}.json"
@@ -477,7 +482,7 @@ class RECOM_OT_OpenInNewBlender(Operator):
     def execute(self, context):
         file_path = self.file_path
         path = Path(file_path)
-        if not path.exists() or not path.is_file():
+        if not path.is_file():
             self.report({"ERROR"}, "File not found")
             return {"CANCELLED"}
 
@@ -537,7 +542,7 @@ class RECOM_OT_OpenBlendOutputPath(Operator):
 
         try:
             normalized_path = frame_path_str.replace("\\", "/")
-            dir_path_obj = Path(normalized_path).parent.resolve()
+            dir_path_obj = Path(normalized_path).parent
             folder_path_str = f"{dir_path_obj.as_posix().rstrip('/')}/"
 
             log.debug("Opening output folder: %s (from frame_path: %s)", folder_path_str, frame_path_str)
@@ -1,7 +1,9 @@
 """Chunk calculation logic for distributing render work across processes/devices."""
 
 import logging
+import re
 from dataclasses import dataclass
+from itertools import accumulate
 from typing import List, Tuple, Union
 
 from ..utils.constants import MODE_LIST, MODE_SEQ, MODE_SINGLE
@@ -10,14 +12,13 @@ from ..utils.cycles_devices import get_cpu_device
 log = logging.getLogger(__name__)
 
 MAX_FRAME_RANGE = 100000
+_FRAME_TOKEN_RE = re.compile(r"\d+(?:-\d+)?")
 
 
 def parse_frame_string(frame_str: str) -> List[int]:
     """Parse a frame range string into a sorted list of integers."""
-    import re
-
     frames = set()
-    tokens = re.findall(r"\d+(?:-\d+)?", frame_str)
+    tokens = _FRAME_TOKEN_RE.findall(frame_str)
     for token in tokens:
         if "-" in token:
             start, end = sorted(map(int, token.split("-")))
@@ -68,11 +69,25 @@ class RenderJobChunk:
     is_animation_call: bool
     description: str
 
+    @property
+    def is_frame_list(self) -> bool:
+        """True when `frames` is an explicit frame list rather than a (start, end, step) range."""
+        return not isinstance(self.frames, tuple)
+
+    @property
+    def frame_bounds(self) -> Tuple[int, int, int]:
+        """(start, end, step) of the chunk; a frame list reports its first and last frame with step 1."""
+        if not self.is_frame_list:
+            return self.frames
+        return self.frames[0], self.frames[-1], 1
+
 
-def calculate_chunks_single_process(prefs, settings, scene, selected_ids, ext_info) -> List[RenderJobChunk]:
+def calculate_chunks_single_process(
+    prefs, settings, scene, selected_ids, ext_info, list_frames=None
+) -> List[RenderJobChunk]:
     """Create a single job chunk for standard execution."""
     if prefs.launch_mode == MODE_LIST:
-        frames = parse_frame_string(settings.frame_list)
+        frames = list_frames if list_frames is not None else parse_frame_string(settings.frame_list)
         is_animation = False
         desc_frames = format_frame_range(frames)
     else:
@@ -106,24 +121,18 @@ def calculate_chunks_sequence_parallel(prefs, settings, scene, selected_devices,
         return []
 
     chunks = []
-    current_start = frame_start
-
-    frames_per_device = total_frames // num_devices
-    remainder = total_frames % num_devices
-
-    if prefs.frame_allocation != "FRAME_SPLIT":
-        frames_per_device = 0
+    is_split = prefs.frame_allocation == "FRAME_SPLIT"
+    split_ranges = _split_sequence(frame_start, frame_step, total_frames, num_devices) if is_split else None
+    cpu_id = _get_combined_cpu_id(prefs)
 
     for i in range(num_devices):
         device = selected_devices[i]
-        device_ids = _get_combined_device_ids(prefs, device)
-
-        if prefs.frame_allocation == "FRAME_SPLIT":
-            count = frames_per_device + (1 if i < remainder else 0)
-            current_end = current_start + (count - 1) * frame_step
-            chunk_frames = (current_start, current_end, frame_step)
-            desc = f"Worker[#{i}] | Split: [{current_start}-{current_end}]"
-            current_start = current_end + frame_step
+        device_ids = _get_combined_device_ids(device, cpu_id)
+
+        if is_split:
+            split_start, split_end = split_ranges[i]
+            chunk_frames = (split_start, split_end, frame_step)
+            desc = f"Worker[#{i}] | Split: [{split_start}-{split_end}]"
         else:
             chunk_frames = (frame_start, frame_end, frame_step)
             desc = f"Worker[#{i}] | FullRange: [{frame_start}-{frame_end}]"
@@ -133,9 +142,9 @@ def calculate_chunks_sequence_parallel(prefs, settings, scene, selected_devices,
     return chunks
 
 
-def calculate_chunks_list_parallel(prefs, settings, selected_devices) -> List[RenderJobChunk]:
+def calculate_chunks_list_parallel(prefs, settings, selected_devices, list_frames=None) -> List[RenderJobChunk]:
     """Split a list of frames across available devices."""
-    frames = parse_frame_string(settings.frame_list)
+    frames = list_frames if list_frames is not None else parse_frame_string(settings.frame_list)
     if not frames:
         log.error("No valid frames specified.")
         return []
@@ -144,17 +153,11 @@ def calculate_chunks_list_parallel(prefs, settings, selected_devices) -> List[Re
     num_devices = min(len(selected_devices), total_frames)
 
     chunks = []
-    frames_per_device = total_frames // num_devices
-    remainder = total_frames % num_devices
-    current_idx = 0
+    cpu_id = _get_combined_cpu_id(prefs)
 
-    for i in range(num_devices):
+    for i, subset in enumerate(_split_list(frames, num_devices)):
         device = selected_devices[i]
-        device_ids = _get_combined_device_ids(prefs, device)
-
-        end_idx = current_idx + frames_per_device + (1 if i < remainder else 0)
-        subset = frames[current_idx:end_idx]
-        current_idx = end_idx
+        device_ids = _get_combined_device_ids(device, cpu_id)
 
         if subset:
             desc = f"Worker[#{i}] | Frame: {format_frame_range(subset)}"
@@ -176,23 +179,17 @@ def calculate_chunks_iterations_parallel(
         return []
 
     chunks = []
-    current_start = frame_start
-    frames_per_process = total_frames // actual_process_count
-    remainder = total_frames % actual_process_count
-
-    if prefs.frame_allocation != "FRAME_SPLIT":
-        frames_per_process = 0
+    is_split = prefs.frame_allocation == "FRAME_SPLIT"
+    split_ranges = _split_sequence(frame_start, frame_step, total_frames, actual_process_count) if is_split else None
 
     for i in range(actual_process_count):
         device_ids = []
 
-        if prefs.frame_allocation == "FRAME_SPLIT":
-            count = frames_per_process + (1 if i < remainder else 0)
-            current_end = current_start + (count - 1) * frame_step
-            chunk_frames = (current_start, current_end, frame_step)
-            desc = f"Worker[#{i}] | Split:[{current_start}-{current_end}]"
+        if is_split:
+            split_start, split_end = split_ranges[i]
+            chunk_frames = (split_start, split_end, frame_step)
+            desc = f"Worker[#{i}] | Split:[{split_start}-{split_end}]"
             chunks.append(RenderJobChunk(i, device_ids, chunk_frames, True, desc))
-            current_start = current_end + frame_step
         else:
             chunk_frames = (frame_start, frame_end, frame_step)
             desc = f"Worker[#{i}] | FullRange:[{frame_start}-{frame_end}]"
@@ -201,9 +198,9 @@ def calculate_chunks_iterations_parallel(
     return chunks
 
 
-def calculate_chunks_list_iterations(settings, process_count: int) -> List[RenderJobChunk]:
+def calculate_chunks_list_iterations(settings, process_count: int, list_frames=None) -> List[RenderJobChunk]:
     """Split a frame list across multiple processes (Iterations)."""
-    frames = parse_frame_string(settings.frame_list)
+    frames = list_frames if list_frames is not None else parse_frame_string(settings.frame_list)
     if not frames:
         log.error("No valid frames specified.")
         return []
@@ -215,16 +212,9 @@ def calculate_chunks_list_iterations(settings, process_count: int) -> List[Rende
         return []
 
     chunks = []
-    frames_per_process = total_frames // actual_process_count
-    remainder = total_frames % actual_process_count
-    current_idx = 0
 
-    for i in range(actual_process_count):
+    for i, subset in enumerate(_split_list(frames, actual_process_count)):
         device_ids = []
-        count = frames_per_process + (1 if i < remainder else 0)
-        end_idx = current_idx + count
-        subset = frames[current_idx:end_idx]
-        current_idx = end_idx
 
         if subset:
             desc = f"Worker[#{i}] | Frame: {format_frame_range(subset)}"
@@ -233,6 +223,21 @@ def calculate_chunks_list_iterations(settings, process_count: int) -> List[Rende
     return chunks
 
 
+def _split_sequence(frame_start: int, frame_step: int, total_frames: int, count: int) -> List[Tuple[int, int]]:
+    """Split a stepped frame range into `count` contiguous (start, end) ranges, larger ranges first."""
+    base, remainder = divmod(total_frames, count)
+    sizes = [base + 1] * remainder + [base] * (count - remainder)
+    starts = accumulate((size * frame_step for size in sizes[:-1]), initial=frame_start)
+    return [(start, start + (size - 1) * frame_step) for start, size in zip(starts, sizes)]
+
+
+def _split_list(frames: List[int], count: int) -> List[List[int]]:
+    """Split a frame list into `count` contiguous, balanced slices, larger slices first."""
+    base, remainder = divmod(len(frames), count)
+    bounds = list(accumulate([base + 1] * remainder + [base] * (count - remainder), initial=0))
+    return [frames[lo:hi] for lo, hi in zip(bounds, bounds[1:])]
+
+
 def _get_frame_settings(prefs, settings, scene, is_animation, ext_info):
     """Retrieve valid frame range parameters based on launch mode and scene data."""
 
@@ -268,10 +273,17 @@ def _get_frame_settings(prefs, settings, scene, is_animation, ext_info):
     return (scene.frame_current,) * 2 + (1,)
 
 
-def _get_combined_device_ids(prefs, primary_device):
-    """Combine CPU with GPU if preference is set."""
+def _get_combined_cpu_id(prefs):
+    """Id of the CPU to pair with every GPU worker, or None if the CPU is not combined."""
     if prefs.combine_cpu_with_gpus:
         cpu_device = get_cpu_device(prefs)
         if cpu_device:
-            return [primary_device.id, cpu_device.id]
+            return cpu_device.id
+    return None
+
+
+def _get_combined_device_ids(primary_device, cpu_id):
+    """Combine CPU with GPU if preference is set."""
+    if cpu_id:
+        return [primary_device.id, cpu_id]
     return [primary_device.id]
@@ -6,6 +6,7 @@ the script generation engine to produce final exportable assets.
 """
 
 import logging
+import os
 import random
 import re
 import string
@@ -56,11 +57,28 @@ from .chunk_calculators import (
     format_frame_range,
     parse_frame_string,
 )
-from .generate_scripts.file_writer import _resolve_script_base_name, create_process_files
+from .generate_scripts.file_writer import (
+    _resolve_script_base_name,
+    create_process_files,
+    prepare_wrapper_context,
+)
 from .generate_scripts.python_script import _generate_base_script
 
 log = logging.getLogger(__name__)
 
+_RENDER_TEMPLATE_RE = re.compile(RENDER_TEMPLATE_PATTERN)
+
+# Emitted after a frame list loop; start_time is set by the render time tracking prologue
+_TIMING_SUFFIX_LINES = (
+    "end_time = time.time()",
+    "total_seconds = end_time - start_time",
+    "hours, remainder = divmod(total_seconds, 3600)",
+    "minutes, seconds = divmod(remainder, 60)",
+    "",
+    'log.info("Render completed in %02d:%02d:%05.2f", int(hours), int(minutes), seconds)',
+    "",
+)
+
 
 def generate_job_id() -> str:
     alphabet = string.digits + string.ascii_uppercase
@@ -86,23 +104,23 @@ def validate_render_settings(operator, context) -> bool:
     scene = context.scene
 
     ext_info = {}
-    if settings.use_external_blend:
-        ext_info = get_scene_info(settings) or {}
 
     # Blend File
     if settings.use_external_blend:
-        if not is_blend_or_backup_file(settings.external_blend_file_path):
-            msg = "Invalid Blender file"
+        scene_info_str = settings.external_scene_info
+        if not scene_info_str or scene_info_str.isspace() or scene_info_str == "{}":
+            msg = "Scene metadata not loaded"
             operator.report({"WARNING"}, msg)
             log.error("%s", msg)
             return False
 
-        if not settings.external_scene_info or settings.external_scene_info == "{}":
-            msg = "Scene metadata not loaded"
+        if not is_blend_or_backup_file(settings.external_blend_file_path):
+            msg = "Invalid Blender file"
             operator.report({"WARNING"}, msg)
             log.error("%s", msg)
             return False
 
+        ext_info = get_scene_info(settings) or {}
         if ext_info.get("blend_filepath", "") != settings.external_blend_file_path:
             msg = "Mismatch between scene data and file. Reload scene data."
             operator.report({"WARNING"}, msg)
@@ -137,9 +155,9 @@ def validate_render_settings(operator, context) -> bool:
             return False
 
     # FFMPEG File Format
-    if not settings.override_settings.file_format_override:
-        is_mov = settings.use_external_blend and ext_info.get("is_movie_format", False)
-        if prefs.launch_mode != MODE_SEQ and (scene.render.is_movie_format or is_mov):
+    if prefs.launch_mode != MODE_SEQ and not settings.override_settings.file_format_override:
+        is_mov = ext_info.get("is_movie_format", False)
+        if is_mov or scene.render.is_movie_format:
             msg = "Current mode does not support FFMPEG animation output"
             operator.report({"WARNING"}, msg)
             log.error("%s", msg)
@@ -267,15 +285,18 @@ class RECOM_OT_ExportRenderScript(Operator):
             else bpy.data.filepath
         )
 
+        # Frame List
+        list_frames = parse_frame_string(settings.frame_list) if prefs.launch_mode == MODE_LIST else None
+
         settings.render_id = generate_job_id()
         settings.folder_opened = False
         render_engine = get_render_engine(context)
 
-        self._add_to_history(context, prefs, settings, scene, render_engine, ext_info)
+        self._add_to_history(context, prefs, settings, blend_file, scene, render_engine, ext_info, list_frames)
 
         # Dispatch based on Engine and Parallelism logic
         if render_engine == RE_CYCLES:
-            result = self._execute_cycles_export(context, prefs, settings, blend_file, scene, ext_info)
+            result = self._execute_cycles_export(context, prefs, settings, blend_file, scene, ext_info, list_frames)
             if result == {"CANCELLED"}:
                 return result
 
@@ -285,14 +306,14 @@ class RECOM_OT_ExportRenderScript(Operator):
 
             # Logic Router
             if is_multi_instance and prefs.launch_mode == MODE_LIST:
-                chunks = calculate_chunks_list_iterations(settings, render_iterations)
+                chunks = calculate_chunks_list_iterations(settings, render_iterations, list_frames)
 
             elif is_multi_instance and prefs.launch_mode == MODE_SEQ:
                 chunks = calculate_chunks_iterations_parallel(prefs, settings, scene, render_iterations, ext_info)
 
             else:
                 # Single Process (Single frame, or List/Seq with multi_instance=False)
-                chunks = calculate_chunks_single_process(prefs, settings, scene, [], ext_info)
+                chunks = calculate_chunks_single_process(prefs, settings, scene, [], ext_info, list_frames)
 
             if not chunks:
                 return {"CANCELLED"}
@@ -335,7 +356,7 @@ class RECOM_OT_ExportRenderScript(Operator):
             return Path(blend_dir).parent
 
         if prefs.export_output_target == "CUSTOM_PATH" and prefs.custom_export_path:
-            custom_path = Path(prefs.custom_export_path).resolve()
+            custom_path = Path(os.path.abspath(prefs.custom_export_path))
             if not custom_path.exists():
                 log.warning(
                     "Custom export path does not exist: '%s'. Using temp directory instead.",
@@ -350,12 +371,17 @@ class RECOM_OT_ExportRenderScript(Operator):
 
         return temp_dir
 
-    def _add_to_history(self, context, prefs, settings, scene, render_engine, ext_info: dict) -> None:
+    def _add_to_history(
+        self, context, prefs, settings, blend_path, scene, render_engine, ext_info: dict, list_frames
+    ) -> None:
         """Records the current render task details into the addon's persistent history collection."""
 
         history_item = prefs.render_history.add()
 
         override_settings = settings.override_settings
+        cycles_overrides = override_settings.cycles
+        render = scene.render
+        launch_mode = prefs.launch_mode
         is_external = settings.use_external_blend
         is_eevee = render_engine in {RE_EEVEE_NEXT, RE_EEVEE}
 
@@ -363,17 +389,11 @@ class RECOM_OT_ExportRenderScript(Operator):
             ext_info = {}
 
         # File Paths
-        blend_path = (
-            bpy.path.abspath(settings.external_blend_file_path)
-            if (is_external and settings.external_blend_file_path)
-            else bpy.data.filepath
-        )
-
         if blend_path:
-            path_obj = Path(blend_path)
-            history_item.blend_path = str(path_obj)
-            history_item.blend_dir = str(path_obj.parent)
-            history_item.blend_file_name = path_obj.name
+            blend_path = os.path.normpath(blend_path)
+            history_item.blend_path = blend_path
+            history_item.blend_dir = os.path.dirname(blend_path)
+            history_item.blend_file_name = os.path.basename(blend_path)
         else:
             history_item.blend_path = "Unknown"
             history_item.blend_dir = "Unknown"
@@ -391,16 +411,16 @@ class RECOM_OT_ExportRenderScript(Operator):
                 else calculate_auto_height(context)
             )
         else:
-            history_item.resolution_x = ext_info.get("resolution_x", 0) if is_external else scene.render.resolution_x
-            history_item.resolution_y = ext_info.get("resolution_y", 0) if is_external else scene.render.resolution_y
+            history_item.resolution_x = ext_info.get("resolution_x", 0) if is_external else render.resolution_x
+            history_item.resolution_y = ext_info.get("resolution_y", 0) if is_external else render.resolution_y
 
         # Samples
         if render_engine == RE_CYCLES:
-            if override_settings.cycles.sampling_override:
+            if cycles_overrides.sampling_override:
                 history_item.samples = (
-                    f"{int(override_settings.cycles.sampling_factor)}%"
-                    if override_settings.cycles.sampling_mode == "FACTOR"
-                    else str(override_settings.cycles.samples)
+                    f"{int(cycles_overrides.sampling_factor)}%"
+                    if cycles_overrides.sampling_mode == "FACTOR"
+                    else str(cycles_overrides.samples)
                 )
             else:
                 history_item.samples = str(ext_info.get("samples", 0) if is_external else scene.cycles.samples)
@@ -414,9 +434,9 @@ class RECOM_OT_ExportRenderScript(Operator):
                 )
 
         # Frames
-        if prefs.launch_mode == MODE_LIST and settings.frame_list:
-            frames = format_frame_range(parse_frame_string(settings.frame_list))
-        elif prefs.launch_mode == MODE_SEQ:
+        if launch_mode == MODE_LIST and settings.frame_list:
+            frames = format_frame_range(list_frames)
+        elif launch_mode == MODE_SEQ:
             if override_settings.frame_range_override:
                 frames = f"{override_settings.frame_start}-{override_settings.frame_end}"
             else:
@@ -439,15 +459,15 @@ class RECOM_OT_ExportRenderScript(Operator):
             if override_settings.file_format_override
             else ext_info.get("file_format", "")
             if is_external
-            else scene.render.image_settings.file_format
+            else render.image_settings.file_format
         )
-        prop = scene.render.image_settings.bl_rna.properties["file_format"]
+        prop = render.image_settings.bl_rna.properties["file_format"]
         history_item.file_format = prop.enum_items[fmt_id].name if fmt_id in prop.enum_items else fmt_id
 
         # Metadata and Export Path
         history_item.render_engine = render_engine
         history_item.render_id = settings.render_id
-        history_item.launch_mode = format_to_title_case(prefs.launch_mode)
+        history_item.launch_mode = format_to_title_case(launch_mode)
         history_item.date = datetime.now().strftime("%d/%m %H:%M:%S")
 
         export_path = Path(bpy.path.abspath(self.directory))
@@ -472,7 +492,7 @@ class RECOM_OT_ExportRenderScript(Operator):
         elif is_external:
             history_item.motion_blur = ext_info.get("use_motion_blur", False)
         else:
-            history_item.motion_blur = scene.render.use_motion_blur
+            history_item.motion_blur = render.use_motion_blur
 
         # Compositing
         if override_settings.compositor_override:
@@ -480,35 +500,31 @@ class RECOM_OT_ExportRenderScript(Operator):
         elif is_external:
             history_item.compositing = ext_info.get("use_compositor", False)
         else:
-            history_item.compositing = scene.render.use_compositing and (
+            history_item.compositing = render.use_compositing and (
                 bool(scene.compositing_node_group) if bpy.app.version >= (5, 0, 0) else scene.use_nodes
             )
 
         # Manage History List Limits
-        item_index = len(prefs.render_history) - 1
-        prefs.render_history.move(item_index, 0)
+        history = prefs.render_history
+        while len(history) > RENDER_HISTORY_LIMIT:
+            history.remove(len(history) - 2)
 
-        if len(prefs.render_history) > RENDER_HISTORY_LIMIT:
-            prefs.render_history.remove(RENDER_HISTORY_LIMIT)
+        history.move(len(history) - 1, 0)
 
-    def _execute_cycles_export(self, context, prefs, settings, blend_file, scene, ext_info: dict) -> set[str]:
+    def _execute_cycles_export(
+        self, context, prefs, settings, blend_file, scene, ext_info: dict, list_frames
+    ) -> set[str]:
         """Generate export scripts for Cycles engine, handling device selection and splitting."""
 
         devices_to_display = get_devices_for_display(prefs, context)
-        selected_devices = [d for d in devices_to_display if d.use]
         current_backend = get_compute_device_type(prefs, context)
 
-        # Handle CPU/GPU combination logic
-        if prefs.launch_mode in {MODE_SEQ, MODE_LIST} and prefs.device_parallel:
-            selected_devices = [
-                d for d in devices_to_display if d.use and (not prefs.combine_cpu_with_gpus or d.type != "CPU")
-            ]
+        skip_cpu = prefs.launch_mode in {MODE_SEQ, MODE_LIST} and prefs.device_parallel and prefs.combine_cpu_with_gpus
+        selected_devices = [d for d in devices_to_display if d.use and not (skip_cpu and d.type == "CPU")]
 
         # Handle fallback to CPU if no backend/devices
         if current_backend == "NONE":
-            self._handle_cpu_fallback(prefs, context)
-            devices_to_display = get_devices_for_display(prefs, context)
-            selected_devices = [d for d in devices_to_display if d.use]
+            devices_to_display, selected_devices = self._handle_cpu_fallback(prefs, context, devices_to_display)
         elif not selected_devices:
             self._handle_no_devices_selected(prefs, context)
 
@@ -528,14 +544,14 @@ class RECOM_OT_ExportRenderScript(Operator):
             if prefs.launch_mode == MODE_SEQ:
                 chunks = calculate_chunks_sequence_parallel(prefs, settings, scene, selected_devices, ext_info)
             elif prefs.launch_mode == MODE_LIST:
-                chunks = calculate_chunks_list_parallel(prefs, settings, selected_devices)
+                chunks = calculate_chunks_list_parallel(prefs, settings, selected_devices, list_frames)
             else:  # MODE_SINGLE, falling back to single process logic
                 selected_ids = [d.id for d in selected_devices]
-                chunks = calculate_chunks_single_process(prefs, settings, scene, selected_ids, ext_info)
+                chunks = calculate_chunks_single_process(prefs, settings, scene, selected_ids, ext_info, list_frames)
         else:
             # CPU or Single GPU or Single Process Mode
             selected_ids = [d.id for d in selected_devices]
-            chunks = calculate_chunks_single_process(prefs, settings, scene, selected_ids, ext_info)
+            chunks = calculate_chunks_single_process(prefs, settings, scene, selected_ids, ext_info, list_frames)
 
         if not chunks:
             return {"CANCELLED"}
@@ -545,12 +561,16 @@ class RECOM_OT_ExportRenderScript(Operator):
         settings.worker_count = len(chunks)
         return self._process_render_chunks(context, prefs, settings, blend_file, chunks, ext_info)
 
-    def _handle_cpu_fallback(self, prefs, context=None):
+    def _handle_cpu_fallback(self, prefs, context, devices_to_display) -> tuple[list, list]:
+        """Enable CPU devices and return the (devices_to_display, selected_devices) to use afterwards."""
         if prefs.manage_cycles_devices:
             for device in prefs.devices:
                 if device.type == "CPU":
                     device.use = True
             prefs.compute_device_type = "NONE"
+            devices_to_display = get_devices_for_display(prefs, context)
+
+        return devices_to_display, [d for d in devices_to_display if d.use]
 
     def _handle_no_devices_selected(self, prefs, context=None):
         if prefs.manage_cycles_devices:
@@ -576,15 +596,22 @@ class RECOM_OT_ExportRenderScript(Operator):
         folder_name = prefs.export_scripts_folder_name if prefs.export_scripts_subfolder else ""
         target_dir = Path(self.directory) / folder_name
 
-        if not target_dir.exists():
-            target_dir.mkdir(parents=True, exist_ok=True)
+        target_dir.mkdir(parents=True, exist_ok=True)
 
         settings.first_worker_info = ""
 
+        wrapper = prepare_wrapper_context(prefs, blend_file, target_dir)
+
+        # Output Settings
+        out_path = self._resolve_output_path(prefs, settings, context.scene, ext_info)
+        limit_cpu_threads = prefs.cpu_threads_limit != 0 and get_cpu_device(prefs, context) is not None
+
         generated_script_paths = []
         for chunk in chunks:
             # Generate the Python Content
-            script_lines = self._generate_chunk_python_script(context, prefs, settings, context.scene, chunk, ext_info)
+            script_lines = self._generate_chunk_python_script(
+                context, prefs, settings, chunk, out_path, limit_cpu_threads
+            )
 
             # Identifiers
             process_id = chunk.process_index
@@ -594,21 +621,19 @@ class RECOM_OT_ExportRenderScript(Operator):
                 self,
                 prefs,
                 settings,
-                blend_file,
                 script_lines,
                 process_id,
                 target_dir,
                 chunk.frames,
+                wrapper,
             )
 
             if shell_script_path:
                 generated_script_paths.append(shell_script_path)
 
             if settings.first_worker_info == "":
-                blend_name = Path(blend_file).stem if blend_file else "untitled"
-                sanitized_blend_name = bpy.path.clean_name(blend_name)
                 settings.first_worker_info = _resolve_script_base_name(
-                    sanitized_blend_name, settings, prefs, chunk.frames
+                    wrapper.sanitized_blend_name, settings, prefs, chunk.frames, wrapper.export_date
                 )
 
         if not generated_script_paths:
@@ -617,17 +642,15 @@ class RECOM_OT_ExportRenderScript(Operator):
         return {"FINISHED"}
 
     def _generate_chunk_python_script(
-        self, context, prefs, settings, scene, chunk: RenderJobChunk, ext_info: dict
+        self, context, prefs, settings, chunk: RenderJobChunk, out_path: str, limit_cpu_threads: bool
     ) -> List[str]:
         """Generates the full Python script content for a specific chunk."""
 
         # Determine Frame Bounds for Base Script (start, end, step)
-        if isinstance(chunk.frames, tuple):
-            f_start, f_end, f_step = chunk.frames
-        else:  # List
-            f_start = chunk.frames[0]
-            f_end = chunk.frames[-1]
-            f_step = 1
+        f_start, f_end, f_step = chunk.frame_bounds
+
+        launch_mode = prefs.launch_mode
+        write_still = prefs.write_still
 
         print_msg = f"Render ID: {settings.render_id} | {chunk.description}"
         log.debug(print_msg)
@@ -644,7 +667,7 @@ class RECOM_OT_ExportRenderScript(Operator):
         )
 
         # Parallelism specific flags (Placeholder/Overwrite)
-        if prefs.device_parallel and prefs.launch_mode == MODE_SEQ:
+        if launch_mode == MODE_SEQ and prefs.device_parallel:
             script_lines.append("# Parallel Render Settings")
             if prefs.frame_allocation == "FRAME_SPLIT":
                 script_lines.extend(
@@ -664,19 +687,18 @@ class RECOM_OT_ExportRenderScript(Operator):
                 )
 
         # CPU Threads limit
-        if get_cpu_device(prefs, context) and prefs.cpu_threads_limit != 0:
+        if limit_cpu_threads:
             script_lines.append(f"bpy.context.scene.cycles.threads = {prefs.cpu_threads_limit}")
 
         # Output Path & Render Call Logic
 
+        use_frame_path = launch_mode == MODE_SINGLE and "#" in _RENDER_TEMPLATE_RE.sub("", out_path)
+
         # Helper to set path and add render call
-        def add_render_cmd(frame, is_anim, write_still, ext_info):
+        def add_render_cmd(frame, is_anim, write_s):
             script_lines.append("# Filepath Settings")
 
-            out_path = self._resolve_output_path(prefs, settings, scene, ext_info)
-            base_name_no_templates = re.sub(RENDER_TEMPLATE_PATTERN, "", out_path)
-
-            if "#" in base_name_no_templates and prefs.launch_mode == MODE_SINGLE:
+            if use_frame_path:
                 script_lines.append(f'bpy.context.scene.render.filepath = r"{out_path}"')
                 script_lines.append(
                     f"bpy.context.scene.render.filepath = bpy.context.scene.render.frame_path(frame={frame})"
@@ -692,22 +714,20 @@ class RECOM_OT_ExportRenderScript(Operator):
                     "# Start Render",
                     "bpy.ops.render.render(animation=True)"
                     if is_anim
-                    else f"bpy.ops.render.render(animation=False, write_still={write_still})",
+                    else f"bpy.ops.render.render(animation=False, write_still={write_s})",
                     "",
                 ]
             )
 
         if chunk.is_animation_call:
             # Mode: Sequence
-            add_render_cmd(f_start, True, False, ext_info)
-        elif isinstance(chunk.frames, tuple):
+            add_render_cmd(f_start, True, False)
+        elif not chunk.is_frame_list:
             # Mode: Single Frame (tuple used in single process fallback)
-            write_s = prefs.write_still or settings.override_settings.output_path_override
-            add_render_cmd(f_start, False, write_s, ext_info)
+            write_s = write_still or settings.override_settings.output_path_override
+            add_render_cmd(f_start, False, write_s)
         else:
             # Mode: List (list of frames)
-            out_path = self._resolve_output_path(prefs, settings, scene, ext_info)
-
             is_contiguous = len(chunk.frames) > 1 and (chunk.frames[-1] - chunk.frames[0] == len(chunk.frames) - 1)
 
             if is_contiguous:
@@ -726,28 +746,19 @@ class RECOM_OT_ExportRenderScript(Operator):
                     "",
                     frames_str,
                     "",
+                    "scene = bpy.context.scene",
                     "for frame in frames_to_render:",
-                    "    bpy.context.scene.render.filepath = base_filepath",
-                    "    bpy.context.scene.frame_set(frame)",
-                    "    bpy.context.scene.render.filepath = bpy.context.scene.render.frame_path(frame=frame)",
-                    f"    bpy.ops.render.render(animation=False, write_still={prefs.write_still})",
+                    "    scene.render.filepath = base_filepath",
+                    "    scene.frame_set(frame)",
+                    "    scene.render.filepath = scene.render.frame_path(frame=frame)",
+                    f"    bpy.ops.render.render(animation=False, write_still={write_still})",
                     "",
                 ]
             )
 
             # Add timing
             if prefs.track_render_time:
-                script_lines.extend(
-                    [
-                        "end_time = time.time()",
-                        "total_seconds = end_time - start_time",
-                        "hours, remainder = divmod(total_seconds, 3600)",
-                        "minutes, seconds = divmod(remainder, 60)",
-                        "",
-                        'log.info("Render completed in %02d:%02d:%05.2f", int(hours), int(minutes), seconds)',
-                        "",
-                    ]
-                )
+                script_lines.extend(_TIMING_SUFFIX_LINES)
 
         if chunk.process_index == 0:
             # Update history entry with actual output path from the first chunk
@@ -786,7 +797,7 @@ class RECOM_OT_ExportRenderScript(Operator):
 
             # Apply frame formatting
             sep = "." if prefs.filename_separator == "DOT" else "_"
-            file_name_no_templates = re.sub(RENDER_TEMPLATE_PATTERN, "", file_name)
+            file_name_no_templates = _RENDER_TEMPLATE_RE.sub("", file_name)
 
             if "#" not in file_name_no_templates:
                 file_name = f"{file_name}{sep}{'#' * prefs.frame_length_digits}"
@@ -813,11 +824,4 @@ class RECOM_OT_ExportRenderScript(Operator):
 classes = (RECOM_OT_ExportRenderScript,)
 
 
-def register():
-    for cls in classes:
-        bpy.utils.register_class(cls)
-
-
-def unregister():
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+register, unregister = bpy.utils.register_classes_factory(classes)
@@ -1,9 +1,11 @@
 """Creates .py scripts and OS-specific shell/batch wrapper files."""
 
 import logging
+import os
 import shlex
 import stat
 import sys
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
@@ -22,13 +24,100 @@ log = logging.getLogger(__name__)
 _IS_WINDOWS = sys.platform == "win32"
 ADDON_INFO = python_script.ADDON_INFO
 SAFE_MAX_LENGTH = 180
+_LAUNCH_MODE_NAMES = {
+    MODE_SINGLE: "Still",
+    MODE_SEQ: "Animation",
+    MODE_LIST: "List",
+}
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+_EXEC_MODE = 0o755
+
+# Platform-specific wrapper fragments
+if _IS_WINDOWS:
+    _SHELL_HEADER = ("@echo off", f"REM {ADDON_INFO}", "", 'cd /d "%~dp0"', "")
+    _SCRIPT_DIR_EXPR = "%~dp0"
+    _SCRIPT_CHECK = (
+        'if not exist "%RC_SCRIPT%" (',
+        '    echo ERROR: Script not found: "%RC_SCRIPT%"',
+        "    exit /b 1",
+        ")",
+    )
+    _CMD_JOINER = " ^\n    "
+else:
+    _SHELL_HEADER = ("#!/bin/bash", f"# {ADDON_INFO}", "", 'cd "$(dirname "$0")"', "")
+    _SCRIPT_DIR_EXPR = "$(pwd)/"
+    _SCRIPT_CHECK = (
+        'if [ ! -f "$RC_SCRIPT" ]; then',
+        '    echo "ERROR: Script not found: $RC_SCRIPT"',
+        "    exit 1",
+        "fi",
+    )
+    _CMD_JOINER = " \\\n    "
 
 
-def _get_log_file_path(prefs, blend_file, log_filename: str, target_dir=None) -> str:
-    """Determine the log folder based on preferences and return the full log file path."""
-    if not prefs.log_to_file:
+def _write_bytes(path: Path, data: bytes, mode: int = 0o666, executable: bool = False) -> None:
+    """Write bytes through a raw file descriptor, skipping the buffered/text IO layers."""
+    fd = os.open(path, _WRITE_FLAGS, mode)
+    try:
+        if executable and not _IS_WINDOWS:
+            # The open mode only applies on creation; an overwritten file keeps its old mode
+            os.fchmod(fd, os.fstat(fd).st_mode | stat.S_IEXEC)
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+def _set_env(var: str, val: str, is_path_expr: bool = False, export: bool = False) -> str:
+    """Return a shell/batch line assigning an environment variable."""
+    if _IS_WINDOWS:
+        if not is_path_expr:
+            val = val.replace("%", "%%")
+        return f'set "{var}={val}"'
+    prefix = "export " if export else ""
+    safe_val = f'"{val}"' if is_path_expr else shlex.quote(val)
+    return f"{prefix}{var}={safe_val}"
+
+
+def _ref_env(var: str) -> str:
+    """Return a quoted shell/batch reference to an environment variable."""
+    return f'"%{var}%"' if _IS_WINDOWS else f'"${var}"'
+
+
+def _resolve_ocio_path(prefs) -> str:
+    """Return the validated OCIO config path, or an empty string when unset or invalid."""
+    if not (prefs.set_ocio and prefs.ocio_path):
         return ""
 
+    ocio_path = Path(bpy.path.abspath(prefs.ocio_path))
+    if ocio_path.suffix.lower() == ".ocio" and ocio_path.exists():
+        return str(ocio_path)
+
+    log.warning('Invalid OCIO path: "%s"', prefs.ocio_path)
+    return ""
+
+
+def _resolve_additional_scripts(prefs) -> tuple[list[str], list[str]]:
+    """Validate the PRE and POST additional scripts in a single pass over the collection."""
+    resolved = {"PRE": [], "POST": []}
+    if not prefs.append_python_scripts:
+        return resolved["PRE"], resolved["POST"]
+
+    for entry in prefs.additional_scripts:
+        if entry.script_path and entry.order in resolved:
+            abs_path = Path(os.path.normpath(bpy.path.abspath(entry.script_path)))
+            if abs_path.suffix.lower() == ".py" and abs_path.is_file():
+                resolved[entry.order].append(str(abs_path))
+
+    return resolved["PRE"], resolved["POST"]
+
+
+def _get_log_dir(prefs, blend_file, target_dir=None) -> Path | None:
+    """Determine (and create) the log folder based on preferences."""
+    if not prefs.log_to_file:
+        return None
+
     def _ensure_dir(path: Path) -> Path:
         try:
             path.mkdir(parents=True, exist_ok=True)
@@ -42,7 +131,7 @@ def _get_log_file_path(prefs, blend_file, log_filename: str, target_dir=None) ->
         log_folder = _ensure_dir(Path(target_dir) / logs_folder_name_str)
 
     elif prefs.log_to_file_location == "BLEND_PATH":
-        base_folder = Path(blend_file).parent.resolve()
+        base_folder = Path(os.path.normpath(blend_file)).parent
         log_folder = _ensure_dir(base_folder / logs_folder_name_str)
 
     elif prefs.log_to_file_location == "CUSTOM_PATH":
@@ -50,13 +139,45 @@ def _get_log_file_path(prefs, blend_file, log_filename: str, target_dir=None) ->
         if custom_path_str:
             custom_path = Path(bpy.path.abspath(custom_path_str))
         else:
-            custom_path = Path(get_addon_temp_dir())
+            custom_path = get_addon_temp_dir()
 
         log_folder = _ensure_dir(custom_path / logs_folder_name_str)
     else:
-        return ""
+        return None
+
+    return log_folder
+
+
+def _build_blender_env(blend_file) -> tuple[str, str]:
+    """Build the RC_BLENDER and RC_BLEND assignments, which are the same for every worker."""
+    return _set_env("RC_BLENDER", str(bpy.app.binary_path)), _set_env("RC_BLEND", str(blend_file))
+
+
+def _build_blender_command(prefs, pre_count: int, post_count: int) -> str:
+    """Build the wrapper's Blender command line from env var references."""
+    cmd_parts = [
+        _ref_env("RC_BLENDER"),
+        f"--background {_ref_env('RC_BLEND')}",
+    ]
+
+    for i in range(1, pre_count + 1):
+        cmd_parts.append(f"--python {_ref_env(f'RC_PRE_SCRIPT_{i}')}")
+
+    cmd_parts.append(f"--python {_ref_env('RC_SCRIPT')}")
+
+    for i in range(1, post_count + 1):
+        cmd_parts.append(f"--python {_ref_env(f'RC_POST_SCRIPT_{i}')}")
 
-    return str(log_folder / log_filename)
+    if prefs.add_command_line_args:
+        # Passed through verbatim; the wrapper's shell does the tokenizing, so quoted paths survive
+        extra_args = prefs.custom_command_line_args.strip()
+        if extra_args:
+            cmd_parts.append(extra_args)
+
+    if prefs.log_to_file:
+        cmd_parts.append(f"--log-file {_ref_env('RC_LOG')}")
+
+    return _CMD_JOINER.join(cmd_parts)
 
 
 def _format_frame_range(frames) -> str:
@@ -105,14 +226,9 @@ def _resolve_script_base_name(
     settings,
     prefs,
     frames,
+    export_date: str,
 ) -> str:
-    """Build a safe, readable base filename for generated scripts."""
-
-    LAUNCH_MODE_MAP = {
-        MODE_SINGLE: "Still",
-        MODE_SEQ: "Animation",
-        MODE_LIST: "List",
-    }
+    """Build a safe, readable base filename for generated scripts (blend_name must already be clean)."""
 
     def _add(parts, value):
         """Append non-empty values."""
@@ -122,11 +238,11 @@ def _resolve_script_base_name(
     parts = []
 
     if prefs.use_export_date_in_script:
-        _add(parts, datetime.now().strftime("%m-%d_%H%M%S"))
+        _add(parts, export_date)
     if prefs.use_blend_name_in_script:
-        _add(parts, bpy.path.clean_name(blend_name))
+        _add(parts, blend_name)
     if prefs.use_render_type_in_script:
-        _add(parts, LAUNCH_MODE_MAP.get(prefs.launch_mode))
+        _add(parts, _LAUNCH_MODE_NAMES.get(prefs.launch_mode))
     if prefs.custom_script_tag and prefs.custom_script_text:
         _add(parts, bpy.path.clean_name(prefs.custom_script_text))
 
@@ -176,13 +292,53 @@ def _truncate_with_ellipsis(value: str, max_len: int) -> str:
     return value[: max_len - 3].rstrip("_") + "..."
 
 
+@dataclass(frozen=True)
+class WrapperContext:
+    """Wrapper values shared by every worker of one export."""
+
+    blend_name: str
+    sanitized_blend_name: str
+    blender_env: tuple[str, str]
+    ocio_path: str
+    pre_scripts: list[str]
+    post_scripts: list[str]
+    cmd_str: str
+    export_date: str
+    log_dir: Path | None
+
+
+def prepare_wrapper_context(prefs, blend_file, target_dir) -> WrapperContext:
+    """Resolve the per-export wrapper values once, before the workers are written."""
+    blend_name = Path(blend_file).stem if blend_file else "untitled"
+    pre_scripts, post_scripts = _resolve_additional_scripts(prefs)
+
+    return WrapperContext(
+        blend_name=blend_name,
+        sanitized_blend_name=bpy.path.clean_name(blend_name),
+        blender_env=_build_blender_env(blend_file),
+        ocio_path=_resolve_ocio_path(prefs),
+        pre_scripts=pre_scripts,
+        post_scripts=post_scripts,
+        cmd_str=_build_blender_command(prefs, len(pre_scripts), len(post_scripts)),
+        export_date=datetime.now().strftime("%m-%d_%H%M%S"),
+        log_dir=_get_log_dir(prefs, blend_file, target_dir),
+    )
+
+
 def create_process_files(
-    self, prefs, settings, blend_file, script_lines, process_id, target_dir, frames
+    self,
+    prefs,
+    settings,
+    script_lines,
+    process_id,
+    target_dir,
+    frames,
+    wrapper: WrapperContext,
 ) -> Path | None:
     """Creates the .py script and the OS-specific shell/batch script."""
-    blend_name = Path(blend_file).stem
-    sanitized_blend_name = bpy.path.clean_name(blend_name)
-    base_name = _resolve_script_base_name(sanitized_blend_name, settings, prefs, frames)
+    base_name = _resolve_script_base_name(
+        wrapper.sanitized_blend_name, settings, prefs, frames, wrapper.export_date
+    )
 
     exec_extension = ".bat" if _IS_WINDOWS else ".sh"
 
@@ -191,128 +347,45 @@ def create_process_files(
     log_filename = f"{base_name}_worker{process_id}.log"
 
     try:
-        if not target_dir.exists():
-            target_dir.mkdir(parents=True, exist_ok=True)
-
         py_path = target_dir / py_filename
-        py_path.write_text("\n".join(script_lines), encoding="utf-8")
+        _write_bytes(py_path, "\n".join(script_lines).encode("utf-8"))
     except (OSError, IOError) as exc:
         self.report({"ERROR"}, f"Failed to save python script: {exc}")
         return None
 
     # Determine Shell/Batch Script Content
-    blender_exec = str(bpy.app.binary_path)
-    shell_content = []
-
-    def set_env(var: str, val: str, is_path_expr: bool = False, export: bool = False) -> str:
-        if _IS_WINDOWS:
-            if not is_path_expr:
-                val = val.replace("%", "%%")
-            return f'set "{var}={val}"'
-        prefix = "export " if export else ""
-        safe_val = f'"{val}"' if is_path_expr else shlex.quote(val)
-        return f"{prefix}{var}={safe_val}"
-
-    def ref_env(var: str) -> str:
-        return f'"%{var}%"' if _IS_WINDOWS else f'"${var}"'
-
-    if _IS_WINDOWS:
-        shell_content.extend(
-            [
-                "@echo off",
-                f"REM {ADDON_INFO}",
-                "",
-                'cd /d "%~dp0"',
-                "",
-            ]
-        )
-        rc_script_val = f"%~dp0{py_filename}"
-        script_check = [
-            'if not exist "%RC_SCRIPT%" (',
-            '    echo ERROR: Script not found: "%RC_SCRIPT%"',
-            "    exit /b 1",
-            ")",
-        ]
-    else:
-        shell_content.extend(
-            [
-                "#!/bin/bash",
-                f"# {ADDON_INFO}",
-                "",
-                'cd "$(dirname "$0")"',
-                "",
-            ]
-        )
-        rc_script_val = f"$(pwd)/{py_filename}"
-        script_check = [
-            'if [ ! -f "$RC_SCRIPT" ]; then',
-            '    echo "ERROR: Script not found: $RC_SCRIPT"',
-            "    exit 1",
-            "fi",
-        ]
+    shell_content = list(_SHELL_HEADER)
+    rc_script_val = f"{_SCRIPT_DIR_EXPR}{py_filename}"
 
+    shell_content.extend(wrapper.blender_env)
     shell_content.extend(
         [
-            set_env("RC_BLENDER", blender_exec),
-            set_env("RC_BLEND", str(blend_file)),
-            set_env("RC_SCRIPT", rc_script_val, is_path_expr=True),
+            _set_env("RC_SCRIPT", rc_script_val, is_path_expr=True),
             "",
         ]
     )
-    shell_content.extend(script_check)
+    shell_content.extend(_SCRIPT_CHECK)
 
-    if prefs.set_ocio and prefs.ocio_path:
-        ocio_path = Path(bpy.path.abspath(prefs.ocio_path))
-        if ocio_path.exists() and ocio_path.suffix.lower() == ".ocio":
-            shell_content.append(set_env("OCIO", str(ocio_path), export=True))
-        else:
-            log.warning('Invalid OCIO path: "%s"', prefs.ocio_path)
-
-    def add_script_vars(order: str):
-        idx = 1
-        for entry in prefs.additional_scripts:
-            if entry.order == order and entry.script_path:
-                abs_path = Path(bpy.path.abspath(entry.script_path)).resolve()
-                if abs_path.is_file() and abs_path.suffix.lower() == ".py":
-                    shell_content.append(set_env(f"RC_{order}_SCRIPT_{idx}", str(abs_path)))
-                    idx += 1
-        return idx - 1
+    if wrapper.ocio_path:
+        shell_content.append(_set_env("OCIO", wrapper.ocio_path, export=True))
 
-    pre_c = add_script_vars("PRE") if prefs.append_python_scripts else 0
-    post_c = add_script_vars("POST") if prefs.append_python_scripts else 0
-
-    cmd_parts = [
-        ref_env("RC_BLENDER"),
-        f"--background {ref_env('RC_BLEND')}",
-    ]
-
-    for i in range(1, pre_c + 1):
-        cmd_parts.append(f"--python {ref_env(f'RC_PRE_SCRIPT_{i}')}")
-
-    cmd_parts.append(f"--python {ref_env('RC_SCRIPT')}")
-
-    for i in range(1, post_c + 1):
-        cmd_parts.append(f"--python {ref_env(f'RC_POST_SCRIPT_{i}')}")
-
-    if prefs.add_command_line_args and prefs.custom_command_line_args.strip():
-        cmd_parts.append(prefs.custom_command_line_args.strip())
+    for idx, script_path in enumerate(wrapper.pre_scripts, 1):
+        shell_content.append(_set_env(f"RC_PRE_SCRIPT_{idx}", script_path))
+    for idx, script_path in enumerate(wrapper.post_scripts, 1):
+        shell_content.append(_set_env(f"RC_POST_SCRIPT_{idx}", script_path))
 
     if prefs.log_to_file:
-        log_file_path = str(_get_log_file_path(prefs, blend_file, log_filename, target_dir))
-        shell_content.append(set_env("RC_LOG", log_file_path))
-        cmd_parts.append(f"--log-file {ref_env('RC_LOG')}")
-
-    line_continue = " ^" if _IS_WINDOWS else " \\"
-    cmd_str = f"{line_continue}\n    ".join(cmd_parts)
+        log_file_path = str(wrapper.log_dir / log_filename) if wrapper.log_dir else ""
+        shell_content.append(_set_env("RC_LOG", log_file_path))
 
     shell_content.extend(
         [
             "",
-            f'echo "Executing Render: {blend_name} ({settings.render_id} - worker{process_id})"',
+            f'echo "Executing Render: {wrapper.blend_name} ({settings.render_id} - worker{process_id})"',
         ]
     )
     if prefs.log_to_file:
-        shell_content.append(f"echo Log written to: {ref_env('RC_LOG')}")
+        shell_content.append(f"echo Log written to: {_ref_env('RC_LOG')}")
 
     if prefs.parallel_delay > 0 and process_id > 0:
         delay_time = prefs.parallel_delay * process_id
@@ -327,7 +400,7 @@ def create_process_files(
             shell_content.append(f"sleep {delay_time}")
             shell_content.append(f'echo "[Worker {process_id}] Wait complete. Starting render..."')
 
-    shell_content.extend(["", cmd_str, ""])
+    shell_content.extend(["", wrapper.cmd_str, ""])
 
     if prefs.keep_terminal_open:
         shell_content.append("pause" if _IS_WINDOWS else 'read -p "Press enter to exit..."')
@@ -336,10 +409,11 @@ def create_process_files(
 
     exec_path = target_dir / exec_filename
     try:
-        exec_path.write_text("\n".join(shell_content), encoding="utf-8")
-        if not _IS_WINDOWS:
-            current_mode = exec_path.stat().st_mode
-            exec_path.chmod(current_mode | stat.S_IEXEC)
+        content = "\n".join(shell_content)
+        if _IS_WINDOWS:
+            # Keep the CRLF endings text mode used to give .bat files
+            content = content.replace("\n", "\r\n")
+        _write_bytes(exec_path, content.encode("utf-8"), _EXEC_MODE, executable=True)
     except (OSError, IOError) as exc:
         self.report({"ERROR"}, f"Failed to save execution file: {exc}")
         return None
@@ -3,6 +3,7 @@
 import json
 import logging
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 from ...utils.constants import (
@@ -30,16 +31,17 @@ ADDON_INFO = f"Render Commander v{ADDON_VERSION_STR} - Blender v{BLENDER_VERSION
 _TEMPLATE_DIR = Path(__file__).parent / "templates"
 
 
-def _load_template_script(template_name: str) -> list[str]:
-    """Load a template script from the templates directory."""
+@lru_cache(maxsize=None)
+def _read_template(template_name: str) -> tuple[str, ...]:
+    """Read a bundled template once; templates ship with the add-on and never change at runtime."""
     template_path = _TEMPLATE_DIR / template_name
 
     try:
         with open(template_path, "r", encoding="utf-8") as f:
-            return f.read().splitlines()
+            return tuple(f.read().splitlines())
     except FileNotFoundError:
         log.error("Template not found: %s", template_path)
-        return []
+        return ()
 
 
 def _wrap_in_try(lines: list[str], section_name: str, abort_on_fail: bool = False) -> list[str]:
@@ -63,7 +65,7 @@ def _wrap_in_try(lines: list[str], section_name: str, abort_on_fail: bool = Fals
         wrapped.extend(
             [
                 "except Exception as e:",
-                f"    log.error(f'Render Commander: Failed to apply {section_name} -> {{e}}')",
+                f"    log.error('Render Commander: Failed to apply {section_name} -> %s', e)",
                 "",
             ]
         )
@@ -71,19 +73,32 @@ def _wrap_in_try(lines: list[str], section_name: str, abort_on_fail: bool = Fals
 
 
 def _add_logging_formatter(script_lines: list[str]) -> None:
-    generated_lines = _load_template_script("logging_formatter.py")
+    generated_lines = _read_template("logging_formatter.py")
     if generated_lines:
         script_lines.extend(generated_lines)
         script_lines.append("")
 
 
+@lru_cache(maxsize=1)
+def _script_header() -> tuple[str, ...]:
+    """Constant script prefix shared by every generated worker script."""
+    header = [
+        f'"""{ADDON_INFO}"""',
+        "",
+        "import bpy",
+        "",
+    ]
+    _add_logging_formatter(header)
+    return tuple(header)
+
+
 def _add_render_time_tracking(prefs, script_lines: list[str]) -> None:
     """Add script lines for tracking render time for animation and frame list."""
     if not prefs.track_render_time:
         return
 
     if prefs.launch_mode == MODE_SEQ:
-        generated_lines = _load_template_script("render_time.py")
+        generated_lines = _read_template("render_time.py")
         if generated_lines:
             script_lines.extend(_wrap_in_try(generated_lines, "Render Time Tracking"))
             script_lines.append("")
@@ -134,7 +149,7 @@ def _apply_frame_settings(
     if prefs.launch_mode != MODE_LIST:
         script_lines.append("# Frame Settings")
         if override_settings.frame_range_override:
-            script_lines.append('log.info(f"Applying Frame Range override")')
+            script_lines.append('log.info("Applying Frame Range override")')
         script_lines.extend(lines)
 
 
@@ -174,7 +189,7 @@ def _apply_fps_converter_settings(override_settings, script_lines: list[str]) ->
                 "if bpy.context.scene.render.use_motion_blur:",
                 "    old_shutter = bpy.context.scene.render.motion_blur_shutter",
                 "    bpy.context.scene.render.motion_blur_shutter = old_shutter * multiplier",
-                '    log.info(f"Motion blur shutter adjusted: {old_shutter:.3f} -> {bpy.context.scene.render.motion_blur_shutter:.3f}")',
+                '    log.info("Motion blur shutter adjusted: %.3f -> %.3f", old_shutter, bpy.context.scene.render.motion_blur_shutter)',
             ]
         )
 
@@ -371,7 +386,7 @@ def _apply_output_format_settings(override_settings, script_lines: list[str]) ->
             return
 
         script_lines.append("# File Format Settings")
-        script_lines.append('log.info(f"Applying File Format override")')
+        script_lines.append('log.info("Applying File Format override")')
         lines = []
 
         if override_settings.file_format == "OPEN_EXR_MULTILAYER":
@@ -421,7 +436,7 @@ def _apply_compositing_settings(override_settings, script_lines: list[str]) -> N
         return
 
     script_lines.append("# Compositing Settings")
-    script_lines.append('log.info(f"Applying Compositor override")')
+    script_lines.append('log.info("Applying Compositor override")')
     lines = []
     lines.extend(
         [
@@ -594,9 +609,9 @@ def _apply_cycles_device_settings(context, prefs, selected_ids, lines: list[str]
             "",
             "    # Log enabled devices",
             "    if active_devices:",
-            "        log.info(f'Active Devices: {len(active_devices)}')",
+            "        log.info('Active Devices: %d', len(active_devices))",
             "        for d in active_devices:",
-            "            log.info(f'  - {d.name} ({d.type}) [{d.id}]')",
+            "            log.info('  - %s (%s) [%s]', d.name, d.type, d.id)",
             "    elif not is_gpu:",
             "        log.info('Device: CPU')",
             "",
@@ -610,7 +625,7 @@ def _apply_eevee_settings(override_settings, script_lines: list[str]) -> None:
         return
 
     script_lines.append("# EEVEE Settings")
-    script_lines.append('log.info(f"Applying EEVEE override")')
+    script_lines.append('log.info("Applying EEVEE override")')
     eevee = override_settings.eevee
 
     lines = [
@@ -678,21 +693,10 @@ def _generate_base_script(
     start_msg,
 ) -> list[str]:
     """Generate common script parts for both single and parallel rendering."""
-    script_lines = []
+    script_lines = list(_script_header())
 
     override_settings = get_override_settings(context)
 
-    script_lines.extend(
-        [
-            f'"""{ADDON_INFO}"""',
-            "",
-            "import bpy",
-            "",
-        ]
-    )
-
-    _add_logging_formatter(script_lines)
-
     if start_msg:
         script_lines.append(f'log.info("{start_msg}")')
         script_lines.append("")
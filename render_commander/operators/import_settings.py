@@ -3,14 +3,13 @@ Provides the logic required to synchronize render settings between
 the current scene, external blend files, and the Render Commander override system.
 """
 
-import json
 import logging
 
 import bpy
 from bpy.types import Operator
 
 from ..utils.constants import RE_CYCLES, RE_EEVEE, RE_EEVEE_NEXT
-from ..utils.helpers import get_addon_preferences, get_addon_settings, get_render_engine
+from ..utils.helpers import get_addon_preferences, get_addon_settings, get_render_engine, parse_scene_info
 
 log = logging.getLogger(__name__)
 
@@ -34,7 +33,7 @@ class RECOM_OT_ImportAllSettings(Operator):
 
         if settings.use_external_blend:
             try:
-                ext_info = json.loads(settings.external_scene_info)
+                ext_info = parse_scene_info(settings.external_scene_info)
                 if not isinstance(ext_info, dict):
                     raise ValueError("Invalid scene info format")
             except Exception as e:
@@ -249,11 +248,4 @@ class RECOM_OT_ImportAllSettings(Operator):
 classes = (RECOM_OT_ImportAllSettings,)
 
 
-def register():
-    for cls in classes:
-        bpy.utils.register_class(cls)
-
-
-def unregister():
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+register, unregister = bpy.utils.register_classes_factory(classes)
@@ -41,6 +41,15 @@ ADDON_ID_DEFINE = (
     f"'{BASE_NAME}')"
 )
 
+# Shared preset defines
+_WM_DEFINE = ("override_settings = bpy.context.window_manager.recom_render_settings.override_settings",)
+_OVERRIDES_DEFINE = _WM_DEFINE + ("cycles = override_settings.cycles",)
+_CYCLES_DEFINE = ("cycles = bpy.context.window_manager.recom_render_settings.override_settings.cycles",)
+_PREFS_DEFINE = (
+    f"addon_id = {ADDON_ID_DEFINE}",
+    "prefs = bpy.context.preferences.addons[addon_id].preferences",
+)
+
 
 def _save_data_path_overrides_preset(context, name, preset_subdir):
     """Helper to write data_path_overrides to a preset python file."""
@@ -87,34 +96,35 @@ class RECOM_OT_overrides_preset(AddPresetBase, Operator):
     bl_label = "Add Overrides Preset"
     bl_description = "Add or remove a preset"
     preset_menu = "RECOM_PT_overrides_presets"
-    preset_defines = ["override_settings = bpy.context.window_manager.recom_render_settings.override_settings"]
+    preset_defines = _OVERRIDES_DEFINE
     preset_values = [
+        # Cycles paths are grouped and written through the `cycles` define
         # Cycles Sampling Overrides
-        "override_settings.cycles.sampling_override",
-        "override_settings.cycles.sampling_mode",
-        "override_settings.cycles.sampling_factor",
-        "override_settings.cycles.samples",
-        "override_settings.cycles.adaptive_min_samples",
-        "override_settings.cycles.time_limit",
-        "override_settings.cycles.use_adaptive_sampling",
-        "override_settings.cycles.adaptive_threshold",
+        "cycles.sampling_override",
+        "cycles.sampling_mode",
+        "cycles.sampling_factor",
+        "cycles.samples",
+        "cycles.adaptive_min_samples",
+        "cycles.time_limit",
+        "cycles.use_adaptive_sampling",
+        "cycles.adaptive_threshold",
         # Cycles Denoising Settings
-        "override_settings.cycles.denoising_override",
-        "override_settings.cycles.use_denoising",
-        "override_settings.cycles.denoiser",
-        "override_settings.cycles.denoising_input_passes",
-        "override_settings.cycles.denoising_prefilter",
-        "override_settings.cycles.denoising_quality",
-        "override_settings.cycles.denoising_use_gpu",
+        "cycles.denoising_override",
+        "cycles.use_denoising",
+        "cycles.denoiser",
+        "cycles.denoising_input_passes",
+        "cycles.denoising_prefilter",
+        "cycles.denoising_quality",
+        "cycles.denoising_use_gpu",
         # Cycles Performance
-        "override_settings.cycles.device_override",
-        "override_settings.cycles.device",
-        "override_settings.cycles.performance_override",
-        "override_settings.cycles.use_tiling",
-        "override_settings.cycles.tile_size",
-        "override_settings.cycles.use_spatial_splits",
-        "override_settings.cycles.use_compact_bvh",
-        "override_settings.cycles.persistent_data",
+        "cycles.device_override",
+        "cycles.device",
+        "cycles.performance_override",
+        "cycles.use_tiling",
+        "cycles.tile_size",
+        "cycles.use_spatial_splits",
+        "cycles.use_compact_bvh",
+        "cycles.persistent_data",
         # EEVEE
         "override_settings.eevee_override",
         "override_settings.eevee.samples",
@@ -185,7 +195,7 @@ class RECOM_OT_resolution_preset(AddPresetBase, Operator):
     bl_label = "Add Resolution Preset"
     bl_description = "Add or remove a preset"
     preset_menu = "RECOM_PT_resolution_presets"
-    preset_defines = ["override_settings = bpy.context.window_manager.recom_render_settings.override_settings"]
+    preset_defines = _WM_DEFINE
     preset_values = [
         "override_settings.resolution_override",
         "override_settings.resolution_mode",
@@ -205,7 +215,7 @@ class RECOM_OT_output_preset(AddPresetBase, Operator):
     bl_label = "Add Output Path Preset"
     bl_description = "Add or remove a preset"
     preset_menu = "RECOM_PT_output_presets"
-    preset_defines = ["override_settings = bpy.context.window_manager.recom_render_settings.override_settings"]
+    preset_defines = _WM_DEFINE
     preset_values = [
         "override_settings.output_directory",
         "override_settings.output_filename",
@@ -218,7 +228,7 @@ class RECOM_OT_samples_preset(AddPresetBase, Operator):
     bl_label = "Add Samples Preset"
     bl_description = "Add or remove a preset"
     preset_menu = "RECOM_PT_samples_presets"
-    preset_defines = ["cycles = bpy.context.window_manager.recom_render_settings.override_settings.cycles"]
+    preset_defines = _CYCLES_DEFINE
     preset_values = [
         "cycles.sampling_mode",
         "cycles.sampling_factor",
@@ -242,7 +252,7 @@ class RECOM_OT_override_advanced_properties_preset(AddPresetBase, Operator):
     bl_label = "Add Property Overrides Preset"
     bl_description = "Add or remove a preset"
     preset_menu = "RECOM_PT_override_advanced_property_presets"
-    preset_defines = ["override_settings = bpy.context.window_manager.recom_render_settings.override_settings"]
+    preset_defines = _WM_DEFINE
     preset_values = [
         "override_settings.use_data_path_overrides",
         "override_settings.data_path_overrides",
@@ -264,10 +274,7 @@ class RECOM_OT_render_preferences_preset(AddPresetBase, Operator):
     bl_label = "Add Render Preferences Preset"
     bl_description = "Add or remove a preset"
     preset_menu = "RECOM_PT_render_preferences_presets"
-    preset_defines = [
-        f"addon_id = {ADDON_ID_DEFINE}",
-        "prefs = bpy.context.preferences.addons[addon_id].preferences",
-    ]
+    preset_defines = _PREFS_DEFINE
     preset_values = [
         "prefs.auto_save_before_render",
         "prefs.write_still",
@@ -332,10 +339,7 @@ class RECOM_OT_additional_script_preset(AddPresetBase, Operator):
     bl_label = "Add Additional Script Preset"
     bl_description = "Add or remove a preset"
     preset_menu = "RECOM_PT_additional_script_presets"
-    preset_defines = [
-        f"addon_id = {ADDON_ID_DEFINE}",
-        "prefs = bpy.context.preferences.addons[addon_id].preferences",
-    ]
+    preset_defines = _PREFS_DEFINE
     preset_values = ["prefs.additional_scripts"]
     preset_subdir = PRESET_REGISTRY["scripts"]
 
@@ -345,10 +349,7 @@ class RECOM_OT_command_line_arguments_preset(AddPresetBase, Operator):
     bl_label = "Add Command Line Arguments Preset"
     bl_description = "Add or remove a preset"
     preset_menu = "RECOM_PT_command_line_arguments_presets"
-    preset_defines = [
-        f"addon_id = {ADDON_ID_DEFINE}",
-        "prefs = bpy.context.preferences.addons[addon_id].preferences",
-    ]
+    preset_defines = _PREFS_DEFINE
     preset_values = ["prefs.custom_command_line_args"]
     preset_subdir = PRESET_REGISTRY["cmd_args"]
 
@@ -358,10 +359,7 @@ class RECOM_OT_custom_variables_preset(AddPresetBase, Operator):
     bl_label = "Add Custom Variables Preset"
     bl_description = "Add or remove a preset"
     preset_menu = "RECOM_PT_custom_variables_presets"
-    preset_defines = [
-        f"addon_id = {ADDON_ID_DEFINE}",
-        "prefs = bpy.context.preferences.addons[addon_id].preferences",
-    ]
+    preset_defines = _PREFS_DEFINE
     preset_values = ["prefs.custom_variables"]
     preset_subdir = PRESET_REGISTRY["custom_variables"]
 
@@ -379,11 +377,4 @@ classes = (
 )
 
 
-def register():
-    for cls in classes:
-        bpy.utils.register_class(cls)
-
-
-def unregister():
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+register, unregister = bpy.utils.register_classes_factory(classes)
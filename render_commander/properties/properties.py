@@ -18,6 +18,12 @@ from .override_settings import RECOM_PG_OverrideSettings
 
 log = logging.getLogger(__name__)
 
+# Frame list normalization passes, applied in order
+_DASH_SPACING_RE = re.compile(r"\s*-\s*")
+_WHITESPACE_RE = re.compile(r"\s+")
+_COMMA_RUN_RE = re.compile(r",+")
+_COMMA_SPACING_RE = re.compile(r"\s*,\s*")
+
 
 class RECOM_PG_RenderSettings(PropertyGroup):
     """Stores render configuration settings"""
@@ -29,10 +35,10 @@ class RECOM_PG_RenderSettings(PropertyGroup):
 
         value = self.frame_list
         cleaned = "".join(c for c in value if c.isdigit() or c in ",- ")
-        cleaned = re.sub(r"\s*-\s*", "-", cleaned)
-        cleaned = re.sub(r"\s+", ",", cleaned)
-        cleaned = re.sub(r",+", ",", cleaned)
-        cleaned = re.sub(r"\s*,\s*", ", ", cleaned)
+        cleaned = _DASH_SPACING_RE.sub("-", cleaned)
+        cleaned = _WHITESPACE_RE.sub(",", cleaned)
+        cleaned = _COMMA_RUN_RE.sub(",", cleaned)
+        cleaned = _COMMA_SPACING_RE.sub(", ", cleaned)
         cleaned = cleaned.strip(", ")
 
         if cleaned != value:
@@ -6,6 +6,7 @@ import os
 import re
 import subprocess
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Union
 
@@ -20,6 +21,12 @@ _IS_WINDOWS = sys.platform == "win32"
 _IS_MACOS = sys.platform == "darwin"
 _IS_LINUX = sys.platform.startswith("linux")
 
+# Single-braced {token} (not {{escaped}})
+_VARIABLE_RE = re.compile(r"(?<!\{)\{(\w+)\}(?!\})")
+
+# Last parsed external scene info, keyed by its raw JSON string
+_scene_info_cache = {"raw": None, "info": None}
+
 
 def get_addon_settings(context):
     """Helper function to retrieve override settings from context."""
@@ -42,8 +49,24 @@ def get_addon_preferences(context=None):
     return addon.preferences
 
 
+def parse_scene_info(raw: str) -> Any:
+    """Parse external scene info JSON, reusing the previous result while the string is unchanged.
+
+    The returned object is shared by every caller until the string changes, so treat it as read-only;
+    copy it before modifying.
+    """
+    if raw != _scene_info_cache["raw"]:
+        _scene_info_cache["info"] = json.loads(raw)
+        _scene_info_cache["raw"] = raw
+    return _scene_info_cache["info"]
+
+
+@lru_cache(maxsize=1)
 def get_addon_temp_dir() -> Path:
-    """Get the temporary directory for addon-specific files."""
+    """Get the temporary directory for addon-specific files.
+
+    Cached for the session; callers create the subfolders they write into.
+    """
     try:
         return Path(bpy.utils.extension_path_user(base_package, create=True))
     except Exception as e:
@@ -68,7 +91,7 @@ def replace_variables(prefs, path_template: str) -> str:
 
             return variables_map.get(var_name, match.group(0))
 
-        resolved_path_segment = re.sub(r"(?<!\{)\{(\w+)\}(?!\})", replacement_func, path_template)
+        resolved_path_segment = _VARIABLE_RE.sub(replacement_func, path_template)
 
         return resolved_path_segment
 
@@ -113,6 +136,19 @@ def is_blend_or_backup_file(file_path: str) -> bool:
     )
 
 
+# File manager launcher for the running platform
+if _IS_WINDOWS:
+    _open_in_file_manager = os.startfile
+elif _IS_MACOS or _IS_LINUX:
+    _FOLDER_OPENER_CMD = "open" if _IS_MACOS else "xdg-open"
+
+    def _open_in_file_manager(path: str) -> None:
+        subprocess.Popen([_FOLDER_OPENER_CMD, path])
+
+else:
+    _open_in_file_manager = None
+
+
 def open_folder(folder_path: str) -> bool:
     """Open a folder in the system's default file explorer."""
     if not folder_path:
@@ -132,28 +168,22 @@ def open_folder(folder_path: str) -> bool:
         log.error("Invalid path format: %s", e)
         return False
 
-    if path.exists() and not path.is_dir():
-        log.error("Path exists but is a file. Aborting to prevent execution.")
-        return False
-
     try:
         path.mkdir(parents=True, exist_ok=True)
+    except FileExistsError:
+        log.error("Path exists but is a file. Aborting to prevent execution.")
+        return False
     except Exception as e:
         log.error("Failed to create directory: %s", e)
         return False
 
     try:
-        safe_path_str = str(path)
-        if _IS_WINDOWS:
-            os.startfile(safe_path_str)
-        elif _IS_MACOS:
-            subprocess.Popen(["open", safe_path_str])
-        elif _IS_LINUX:
-            subprocess.Popen(["xdg-open", safe_path_str])
-        else:
+        if _open_in_file_manager is None:
             log.error("Unsupported OS.")
             return False
 
+        _open_in_file_manager(str(path))
+
         log.debug('Opened folder: "%s"', path)
         return True
 
@@ -170,7 +200,7 @@ def get_default_resolution(context) -> tuple:
 
     if settings.use_external_blend and settings.external_blend_file_path:
         try:
-            info = json.loads(settings.external_scene_info) if settings.external_scene_info else {}
+            info = parse_scene_info(settings.external_scene_info) if settings.external_scene_info else {}
             res_x = info.get("resolution_x", fallback_res_x)
             res_y = info.get("resolution_y", fallback_res_x)
         except (ValueError, TypeError, json.JSONDecodeError) as e:
@@ -214,7 +244,7 @@ def get_render_engine(context) -> str:
 
     if settings.use_external_blend and settings.external_blend_file_path:
         try:
-            info = json.loads(settings.external_scene_info)
+            info = parse_scene_info(settings.external_scene_info)
             engine_name = info.get("render_engine", "")
         except (json.JSONDecodeError, TypeError):
             log.warning("Invalid Scene Info Data")
@@ -273,12 +303,12 @@ def resolve_blender_path(text: str) -> tuple[str, Any]:
 
 
 def get_scene_info(settings: Any) -> Union[dict, None]:
-    """Single source of truth for scene info parsing"""
+    """Single source of truth for scene info parsing (returns the shared, read-only dict)"""
     if not settings.external_scene_info or not settings.is_scene_info_loaded:
         return None
 
     try:
-        info = json.loads(settings.external_scene_info)
+        info = parse_scene_info(settings.external_scene_info)
         if info.get("blend_filepath", "") == "No Data":
             return None
         return info